@@ -4,10 +4,14 @@ Changelog generation integrated with version bumping.
 Generates changelogs with PR metadata and creates PR descriptions.
 """
 
+import functools
+import io
 import json
 import os
 import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -26,7 +30,268 @@ from changeset.changeset import (
 CHANGESET_DIR = Path(".changeset")
 CONFIG_FILE = CHANGESET_DIR / "config.json"
 
+# Patterns used on every changeset/commit-message, compiled once at import.
+# Commit messages stay as bytes end to end - only matched groups are decoded -
+# so the message-side patterns are byte patterns.
+_PR_RE = re.compile(rb"(?:#|pull request #)(\d+)")
+_COAUTHOR_RE = re.compile(
+    rb"^[ \t]*Co-authored-by:\s*(.+?)\s*<(.+?)>[ \t]*$", re.MULTILINE
+)
+_REMOTE_RE = re.compile(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$")
+_GIT_AUTHOR_RE = re.compile(rb"author (.+?) <")
+
+# Section headings per change type, in output order
+_TYPE_LABELS = {
+    "major": "Major Changes",
+    "minor": "Minor Changes",
+    "patch": "Patch Changes",
+}
+
+# Lazily populated by _bulk_changeset_commits(); maps changeset path (posix,
+# relative to the repo root) -> (commit_hash, commit_message). Messages are
+# kept as raw bytes; only the regex groups pulled out of them get decoded.
+_changeset_commit_cache: dict[str, tuple[str, bytes]] | None = None
+
+
+def _bulk_changeset_commits() -> dict[str, tuple[str, bytes]]:
+    """Find the commit that introduced each changeset file in one git call.
+
+    Runs a single `git log --diff-filter=A --name-only` over the changeset
+    directory instead of one `git log` per file, and returns a mapping of
+    changeset path -> (commit hash, full commit message as bytes).
+    """
+    global _changeset_commit_cache
+    if _changeset_commit_cache is not None:
+        return _changeset_commit_cache
+
+    commits: dict[str, tuple[str, bytes]] = {}
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "log",
+                "--diff-filter=A",
+                "--name-only",
+                "--format=%x02%H%x00%B%x01",
+                "--",
+                str(CHANGESET_DIR),
+            ],
+            capture_output=True,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+        )
+
+        # Each record looks like: \x02<hash>\x00<message>\x01\n<file>\n<file>...
+        for record in result.stdout.split(b"\x02"):
+            if b"\x00" not in record or b"\x01" not in record:
+                continue
+            commit_hash, rest = record.split(b"\x00", 1)
+            commit_msg, files_blob = rest.split(b"\x01", 1)
+            for filename in files_blob.splitlines():
+                filename = filename.strip()
+                if filename:
+                    # git log is newest-first; keep the most recent add
+                    commits.setdefault(
+                        filename.decode(),
+                        (commit_hash.strip().decode(), commit_msg.strip()),
+                    )
+    except subprocess.CalledProcessError:
+        pass
+
+    _changeset_commit_cache = commits
+    return commits
+
+
+class _GitCatFileBatch:
+    """Persistent `git cat-file --batch` session for cheap object reads.
+
+    Spawning git once and streaming hashes over stdin avoids paying process
+    startup for every commit that needs inspecting.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+
+    def read_object(self, ref: str) -> bytes | None:
+        """Read a raw git object, or None if it cannot be resolved."""
+        with self._lock:
+            try:
+                process = self._ensure_process()
+                process.stdin.write(f"{ref}\n".encode())
+                process.stdin.flush()
+                header = process.stdout.readline().decode()
+            except OSError:
+                return None
+
+            # Header is "<oid> <type> <size>", or "<ref> missing"
+            parts = header.split()
+            if len(parts) != 3:
+                return None
+
+            size = int(parts[2])
+            # Object body is followed by a trailing newline
+            return process.stdout.read(size + 1)[:size]
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                close_fds=False,
+            )
+        return self._process
+
+
+_git_cat_file = _GitCatFileBatch()
+
+
+def _commit_author_name(commit_hash: str) -> str:
+    """Get a commit's author name via the persistent cat-file session."""
+    body = _git_cat_file.read_object(commit_hash)
+    if body is None:
+        return ""
+
+    for line in body.splitlines():
+        if not line:
+            # End of the commit headers
+            break
+        match = _GIT_AUTHOR_RE.match(line)
+        if match:
+            return match.group(1).decode("utf-8", "replace")
+
+    return ""
+
+
+# Lazily populated by _bulk_pr_metadata(); maps PR number -> author/co-author
+# info fetched from GitHub.
+_pr_metadata_cache: dict[str, dict] | None = None
+
 
+def _bulk_pr_metadata() -> dict[str, dict]:
+    """Fetch author info for every PR referenced by a pending changeset.
+
+    Collects the PR numbers from the commits that introduced the changesets
+    currently on disk and issues a single `gh api graphql` query with one
+    alias per PR, instead of up to three REST round trips per changeset.
+    Returns a mapping of PR number -> {"author": {...},
+    "commit_authors": [{...}]}, where each author dict has "login", "name"
+    and "email" keys.
+    """
+    global _pr_metadata_cache
+    if _pr_metadata_cache is not None:
+        return _pr_metadata_cache
+
+    _pr_metadata_cache = {}
+
+    git_info = get_git_info()
+    owner = git_info.get("owner")
+    repo = git_info.get("repo")
+    if not owner or not repo:
+        return _pr_metadata_cache
+
+    # Collect the PR numbers referenced by the commits that introduced the
+    # changesets being processed; the bulk commit map also covers config
+    # files and long-deleted changesets, which would bloat the query
+    commits = _bulk_changeset_commits()
+    pr_numbers = set()
+    for filepath, _, _, _ in get_changesets_from_changeset():
+        commit_info = commits.get(Path(filepath).as_posix())
+        if commit_info:
+            pr_match = _PR_RE.search(commit_info[1])
+            if pr_match:
+                pr_numbers.add(pr_match.group(1).decode())
+
+    if not pr_numbers:
+        return _pr_metadata_cache
+
+    # One aliased field per PR so everything comes back in a single response
+    pr_fields = " ".join(
+        f"pr{number}: pullRequest(number: {number}) {{"
+        " author { login ... on User { name email } }"
+        " commits(first: 100) { nodes { commit {"
+        " author { name email user { login } } } } } }"
+        for number in sorted(pr_numbers, key=int)
+    )
+    query = (
+        f'query {{ repository(owner: "{owner}", name: "{repo}") {{ {pr_fields} }} }}'
+    )
+
+    env = os.environ.copy()
+    gh_token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if gh_token:
+        env["GH_TOKEN"] = gh_token
+
+    try:
+        # Let gh project out the envelope server-side so Python only parses
+        # the fields that are actually consumed
+        result = subprocess.run(
+            [
+                "gh",
+                "api",
+                "graphql",
+                "--jq",
+                ".data.repository",
+                "-f",
+                f"query={query}",
+            ],
+            capture_output=True,
+            text=True,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+        )
+    except OSError as e:
+        print(f"⚠️  GitHub CLI failed for PRs {', '.join(sorted(pr_numbers))}: {e!s}")
+        return _pr_metadata_cache
+
+    # gh exits non-zero whenever the response carries GraphQL errors (one
+    # unresolvable PR reference is enough) but still prints whatever data
+    # resolved, so parse stdout regardless and keep the partial result
+    try:
+        repository = json.loads(result.stdout) or {}
+    except ValueError:
+        repository = {}
+
+    if not repository:
+        detail = result.stderr.strip() or f"exit status {result.returncode}"
+        print(f"⚠️  GitHub CLI failed for PRs {', '.join(sorted(pr_numbers))}: {detail}")
+        return _pr_metadata_cache
+
+    for number in pr_numbers:
+        pr_data = repository.get(f"pr{number}")
+        if not pr_data:
+            continue
+
+        author = pr_data.get("author") or {}
+        commit_authors = []
+        for node in (pr_data.get("commits") or {}).get("nodes") or []:
+            commit_author = (node.get("commit") or {}).get("author") or {}
+            user = commit_author.get("user") or {}
+            if user.get("login"):
+                commit_authors.append(
+                    {
+                        "login": user["login"],
+                        "name": commit_author.get("name") or "",
+                        "email": commit_author.get("email") or "",
+                    }
+                )
+
+        _pr_metadata_cache[number] = {
+            "author": {
+                "login": author.get("login") or "",
+                "name": author.get("name") or "",
+                "email": author.get("email") or "",
+            },
+            "commit_authors": commit_authors,
+        }
+
+    return _pr_metadata_cache
+
+
+@functools.cache
 def load_config() -> dict:
     """Load changeset configuration."""
     if not CONFIG_FILE.exists():
@@ -37,41 +302,62 @@ def load_config() -> dict:
         return json.load(f)
 
 
+@functools.cache
 def get_git_info() -> dict:
     """Get git information for the current commit/PR."""
     info = {}
 
-    # Get the current commit hash
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
-        )
-        info["commit"] = result.stdout.strip()[:7]  # Short hash
-    except Exception:
-        info["commit"] = None
+    # In GitHub Actions the environment already carries both pieces, so the
+    # subprocess can be skipped entirely
+    commit_hash = os.environ.get("GITHUB_SHA", "")
+    repository = os.environ.get("GITHUB_REPOSITORY", "")
+    remote_url = ""
+
+    if not commit_hash or not repository:
+        # Get the commit hash and remote URL with a single shell invocation
+        # instead of two git execs; each command echoes a blank line on
+        # failure so the outputs stay on fixed lines
+        try:
+            result = subprocess.run(
+                [
+                    "sh",
+                    "-c",
+                    "git rev-parse HEAD 2>/dev/null || echo; "
+                    "git config --get remote.origin.url 2>/dev/null || echo",
+                ],
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+                close_fds=False,
+            )
+            lines = result.stdout.split("\n")
+        except Exception:
+            lines = []
+
+        if not commit_hash:
+            commit_hash = lines[0].strip() if lines else ""
+        remote_url = lines[1].strip() if len(lines) > 1 else ""
+
+    info["commit"] = commit_hash[:7] if commit_hash else None  # Short hash
 
     # Get GitHub repo info
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        remote_url = result.stdout.strip()
+    if "/" in repository:
+        owner, repo = repository.split("/", 1)
+        info["owner"] = owner
+        info["repo"] = repo
+        info["repo_url"] = f"https://github.com/{owner}/{repo}"
+    elif remote_url:
         # Extract owner/repo from URL
-        match = re.search(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$", remote_url)
+        match = _REMOTE_RE.search(remote_url)
         if match:
             info["owner"] = match.group(1)
             info["repo"] = match.group(2)
             info["repo_url"] = f"https://github.com/{info['owner']}/{info['repo']}"
-    except Exception:
-        pass
 
     return info
 
 
-def get_pr_metadata() -> dict:
+def get_pr_metadata(git_info: dict) -> dict:
     """Get PR metadata from environment or git."""
     metadata = {
         "pr_number": os.environ.get("PR_NUMBER"),
@@ -79,9 +365,6 @@ def get_pr_metadata() -> dict:
         "commit_hash": os.environ.get("COMMIT_SHA", ""),
     }
 
-    # Always get git info for repo URL
-    git_info = get_git_info()
-
     # Use git commit if not in environment
     if not metadata["commit_hash"]:
         metadata["commit_hash"] = git_info.get("commit", "")
@@ -92,253 +375,141 @@ def get_pr_metadata() -> dict:
     return metadata
 
 
-def get_changeset_metadata(changeset_path: Path) -> dict:
+def get_changeset_metadata(changeset_path: Path, git_info: dict) -> dict:
     """Get PR metadata for a specific changeset file.
 
     Finds the commit that introduced the changeset and extracts metadata.
     """
     metadata = {}
-    git_info = get_git_info()
     metadata["repo_url"] = git_info.get("repo_url", "")
 
-    try:
-        # Find the commit that introduced this changeset file
-        result = subprocess.run(
-            ["git", "log", "--format=%H", "--diff-filter=A", "--", str(changeset_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        if result.stdout.strip():
-            commit_hash = result.stdout.strip().split("\n")[0]
-            metadata["commit_hash"] = commit_hash
-
-            # Get the commit message to extract PR number and co-authors
-            msg_result = subprocess.run(
-                ["git", "log", "-1", "--format=%B", commit_hash],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            commit_msg = msg_result.stdout.strip()
-
-            # Extract PR number from commit message (common patterns)
-            # Pattern 1: (#123)
-            # Pattern 2: Merge pull request #123
-            pr_match = re.search(r"(?:#|pull request #)(\d+)", commit_msg)
-            if pr_match:
-                pr_number = pr_match.group(1)
-                metadata["pr_number"] = pr_number
-
-                # Try to get PR author using GitHub CLI if available
-                try:
-                    # Check if we're in GitHub Actions and have a token
-                    gh_token = os.environ.get("GITHUB_TOKEN") or os.environ.get(
-                        "GH_TOKEN"
+    # Find the commit that introduced this changeset file (single batched
+    # git log for all changesets instead of one subprocess per file)
+    commit_info = _bulk_changeset_commits().get(Path(changeset_path).as_posix())
+
+    if commit_info:
+        commit_hash, commit_msg = commit_info
+        metadata["commit_hash"] = commit_hash
+
+        # Extract PR number from commit message (common patterns)
+        # Pattern 1: (#123)
+        # Pattern 2: Merge pull request #123
+        pr_match = _PR_RE.search(commit_msg)
+        if pr_match:
+            pr_number = pr_match.group(1).decode()
+            metadata["pr_number"] = pr_number
+
+            # Look up PR author and co-authors from the batched GraphQL query
+            pr_info = _bulk_pr_metadata().get(pr_number)
+            if pr_info:
+                author = pr_info["author"]
+                if author.get("login"):
+                    metadata["pr_author"] = author["login"]
+                    metadata["pr_author_is_username"] = True
+                    metadata["pr_author_info"] = author
+                    print(
+                        f"✓ Got GitHub username for PR #{pr_number}: "
+                        f"{metadata['pr_author']}"
                     )
 
-                    cmd = [
-                        "gh",
-                        "api",
-                        f"repos/{git_info.get('owner', '')}/"
-                        f"{git_info.get('repo', '')}/pulls/{pr_number}",
-                        "--jq",
-                        ".user.login",
-                    ]
-
-                    env = os.environ.copy()
-                    if gh_token:
-                        env["GH_TOKEN"] = gh_token
-
-                    gh_result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                        env=env,
-                    )
-                    if gh_result.stdout.strip():
-                        metadata["pr_author"] = gh_result.stdout.strip()
-                        metadata["pr_author_is_username"] = True
-                        print(
-                            f"✓ Got GitHub username for PR #{pr_number}: "
-                            f"{metadata['pr_author']}"
-                        )
-
-                    # Also try to get PR author's full info for better deduplication
-                    pr_author_info = {}
-                    if metadata.get("pr_author") and metadata.get(
-                        "pr_author_is_username"
-                    ):
-                        try:
-                            cmd = [
-                                "gh",
-                                "api",
-                                f"users/{metadata['pr_author']}",
-                            ]
-                            user_result = subprocess.run(
-                                cmd,
-                                capture_output=True,
-                                text=True,
-                                check=True,
-                                env=env,
-                            )
-                            if user_result.stdout.strip():
-                                import json
-
-                                user_data = json.loads(user_result.stdout)
-                                pr_author_info = {
-                                    "login": metadata["pr_author"],
-                                    "name": user_data.get("name", ""),
-                                    "email": user_data.get("email", ""),
-                                }
-                                metadata["pr_author_info"] = pr_author_info
-                        except Exception:
-                            pass
-
-                    # Also try to get co-authors from PR commits
-                    try:
-                        # Get all commits in the PR with full author info
-                        cmd = [
-                            "gh",
-                            "api",
-                            f"repos/{git_info.get('owner', '')}/"
-                            f"{git_info.get('repo', '')}/pulls/{pr_number}/commits",
-                        ]
-
-                        commits_result = subprocess.run(
-                            cmd,
-                            capture_output=True,
-                            text=True,
-                            check=True,
-                            env=env,
-                        )
-                        if commits_result.stdout.strip():
-                            commits_data = json.loads(commits_result.stdout)
-
-                            # Build a map of GitHub usernames to their info
-                            github_users = {}
-                            for commit in commits_data:
-                                author = commit.get("author")
-                                if author and author.get("login"):
-                                    username = author["login"]
-                                    pr_author = metadata.get("pr_author")
-                                    if username and username != pr_author:
-                                        commit_data = commit.get("commit", {})
-                                        commit_author = commit_data.get("author", {})
-                                        github_users[username] = {
-                                            "login": username,
-                                            "name": commit_author.get("name", ""),
-                                            "email": commit_author.get("email", ""),
-                                        }
-
-                            if github_users:
-                                metadata["co_authors"] = list(github_users.keys())
-                                metadata["co_authors_are_usernames"] = True
-                                # Store the full user info for deduplication later
-                                metadata["github_user_info"] = github_users
-                    except Exception:
-                        pass
-
-                except Exception as e:
-                    # If gh command fails, try to extract from commit author
-                    print(f"⚠️  GitHub CLI failed for PR #{pr_number}: {e!s}")
-                    author_result = subprocess.run(
-                        ["git", "log", "-1", "--format=%an", commit_hash],
-                        capture_output=True,
-                        text=True,
-                    )
-                    if author_result.stdout.strip():
-                        metadata["pr_author"] = author_result.stdout.strip()
-                        metadata["pr_author_is_username"] = False
-                        print(
-                            f"⚠️  Using git author name for PR #{pr_number}: "
-                            f"{metadata['pr_author']} (no @ will be added)"
-                        )
+                # Build a map of GitHub usernames to their info
+                github_users = {}
+                for commit_author in pr_info["commit_authors"]:
+                    username = commit_author.get("login")
+                    if username and username != metadata.get("pr_author"):
+                        github_users[username] = commit_author
+
+                if github_users:
+                    metadata["co_authors"] = list(github_users.keys())
+                    metadata["co_authors_are_usernames"] = True
+                    # Store the full user info for deduplication later
+                    metadata["github_user_info"] = github_users
             else:
-                # No PR number found, use commit author
-                author_result = subprocess.run(
-                    ["git", "log", "-1", "--format=%an", commit_hash],
-                    capture_output=True,
-                    text=True,
-                )
-                if author_result.stdout.strip():
-                    metadata["pr_author"] = author_result.stdout.strip()
+                # If gh is unavailable, fall back to the git commit author
+                author_name = _commit_author_name(commit_hash)
+                if author_name:
+                    metadata["pr_author"] = author_name
                     metadata["pr_author_is_username"] = False
+                    print(
+                        f"⚠️  Using git author name for PR #{pr_number}: "
+                        f"{metadata['pr_author']} (no @ will be added)"
+                    )
+        else:
+            # No PR number found, use commit author
+            author_name = _commit_author_name(commit_hash)
+            if author_name:
+                metadata["pr_author"] = author_name
+                metadata["pr_author_is_username"] = False
+
+        # Extract co-authors from commit message
+        co_authors_from_commits = []
+        pr_author_info = metadata.get("pr_author_info", {})
+
+        # Single multiline scan instead of splitting and matching line by line
+        for co_author_match in _COAUTHOR_RE.finditer(commit_msg):
+            co_author_name = co_author_match.group(1).decode("utf-8", "replace").strip()
+            co_author_email = (
+                co_author_match.group(2).decode("utf-8", "replace").strip()
+            )
 
-            # Extract co-authors from commit message
-            co_authors_from_commits = []
-            pr_author_info = metadata.get("pr_author_info", {})
-
-            for line in commit_msg.split("\n"):
-                co_author_match = re.match(
-                    r"^Co-authored-by:\s*(.+?)\s*<(.+?)>$", line.strip()
+            # Check if this co-author is actually the PR author
+            is_pr_author = False
+
+            # Direct username match
+            if co_author_name == metadata.get("pr_author"):
+                is_pr_author = True
+            # Check by email
+            elif pr_author_info and co_author_email == pr_author_info.get("email", ""):
+                is_pr_author = True
+            # Check by name
+            elif pr_author_info and co_author_name == pr_author_info.get("name", ""):
+                is_pr_author = True
+
+            if co_author_name and not is_pr_author:
+                co_authors_from_commits.append(
+                    {"name": co_author_name, "email": co_author_email}
                 )
-                if co_author_match:
-                    co_author_name = co_author_match.group(1).strip()
-                    co_author_email = co_author_match.group(2).strip()
-
-                    # Check if this co-author is actually the PR author
-                    is_pr_author = False
-
-                    # Direct username match
-                    if co_author_name == metadata.get("pr_author"):
-                        is_pr_author = True
-                    # Check by email
-                    elif pr_author_info and co_author_email == pr_author_info.get(
-                        "email", ""
-                    ):
-                        is_pr_author = True
-                    # Check by name
-                    elif pr_author_info and co_author_name == pr_author_info.get(
-                        "name", ""
-                    ):
-                        is_pr_author = True
-
-                    if co_author_name and not is_pr_author:
-                        co_authors_from_commits.append(
-                            {"name": co_author_name, "email": co_author_email}
-                        )
-
-            # Deduplicate co-authors using GitHub user info
-            if "co_authors" in metadata and metadata.get("github_user_info"):
-                # We have GitHub users - check if commit co-authors match
-                github_users = metadata.get("github_user_info", {})
-                final_co_authors = []
-
-                # Add all GitHub users
-                for username in metadata["co_authors"]:
-                    final_co_authors.append((username, True))
-
-                # Check commit co-authors against GitHub users
-                for commit_author in co_authors_from_commits:
-                    is_duplicate = False
-                    for username, user_info in github_users.items():
-                        # Check by email (most reliable)
-                        if commit_author["email"] == user_info.get("email", ""):
-                            is_duplicate = True
-                            break
-                        # Check by name
-                        if commit_author["name"] == user_info.get("name", ""):
-                            is_duplicate = True
-                            break
-
-                    if not is_duplicate:
-                        # This is a unique co-author not in GitHub commits
-                        final_co_authors.append((commit_author["name"], False))
-
-                metadata["co_authors"] = final_co_authors
-            elif co_authors_from_commits:
-                # No GitHub API data - just use commit co-authors
-                metadata["co_authors"] = [
-                    (author["name"], False) for author in co_authors_from_commits
-                ]
 
-    except subprocess.CalledProcessError:
-        # If git commands fail, return empty metadata
-        pass
+        # Deduplicate co-authors using GitHub user info
+        if "co_authors" in metadata and metadata.get("github_user_info"):
+            # We have GitHub users - check if commit co-authors match
+            github_users = metadata.get("github_user_info", {})
+            final_co_authors = []
+
+            # Add all GitHub users
+            for username in metadata["co_authors"]:
+                final_co_authors.append((username, True))
+
+            # Check commit co-authors against GitHub users via set lookups
+            # instead of a linear scan per author
+            gh_emails = {
+                user_info["email"]
+                for user_info in github_users.values()
+                if user_info.get("email")
+            }
+            gh_names = {
+                user_info["name"]
+                for user_info in github_users.values()
+                if user_info.get("name")
+            }
+
+            for commit_author in co_authors_from_commits:
+                # Check by email (most reliable), then by name
+                if (
+                    commit_author["email"] in gh_emails
+                    or commit_author["name"] in gh_names
+                ):
+                    continue
+
+                # This is a unique co-author not in GitHub commits
+                final_co_authors.append((commit_author["name"], False))
+
+            metadata["co_authors"] = final_co_authors
+        elif co_authors_from_commits:
+            # No GitHub API data - just use commit co-authors
+            metadata["co_authors"] = [
+                (author["name"], False) for author in co_authors_from_commits
+            ]
 
     # Fall back to environment variables if no specific metadata found
     if not metadata.get("pr_number"):
@@ -356,9 +527,12 @@ def get_changeset_metadata(changeset_path: Path) -> dict:
     return metadata
 
 
-def format_changelog_entry(entry: dict, config: dict, pr_metadata: dict) -> str:
-    """Format a single changelog entry with PR and commit info."""
-    description = entry["description"]
+def _metadata_prefix(pr_metadata: dict) -> str:
+    """Build the PR link / commit link / thanks prefix for a metadata dict.
+
+    Every entry sharing the same metadata shares this prefix, so callers can
+    compute it once per PR instead of per entry.
+    """
     pr_number = pr_metadata.get("pr_number")
     pr_author = pr_metadata.get("pr_author")
     pr_author_is_username = pr_metadata.get("pr_author_is_username", False)
@@ -422,21 +596,35 @@ def format_changelog_entry(entry: dict, config: dict, pr_metadata: dict) -> str:
             all_but_last = ", ".join(authors_to_thank[:-1])
             parts.append(f"Thanks {all_but_last} and {authors_to_thank[-1]}!")
 
-    # Add description
-    parts.append(f"- {description}")
-
     return " ".join(parts)
 
 
+def format_changelog_entry(
+    entry: dict, config: dict, pr_metadata: dict, prefix: str | None = None
+) -> str:
+    """Format a single changelog entry with PR and commit info."""
+    if prefix is None:
+        prefix = _metadata_prefix(pr_metadata)
+
+    description = entry["description"]
+    if prefix:
+        return f"{prefix} - {description}"
+    return f"- {description}"
+
+
 def generate_changelog_section(
-    package: str, new_version: str, entries: list[dict], config: dict, pr_metadata: dict
+    package: str,
+    new_version: str,
+    entries: list[dict],
+    config: dict,
+    pr_metadata: dict,
+    git_info: dict,
 ) -> str:
     """Generate changelog section for a package version."""
-    lines = []
+    buf = io.StringIO()
 
     # Add version header
-    lines.append(f"## {new_version}")
-    lines.append("")
+    buf.write(f"## {new_version}\n\n")
 
     # Group entries by change type
     grouped = {}
@@ -446,33 +634,62 @@ def generate_changelog_section(
             grouped[change_type] = []
         grouped[change_type].append(entry)
 
+    # Fast path for CI: when the environment already names the PR, every
+    # entry shares pr_metadata and the per-changeset git/gh work is skipped
+    if os.environ.get("PR_NUMBER"):
+        filepaths = []
+    else:
+        filepaths = list(
+            {entry["filepath"] for entry in entries if "filepath" in entry}
+        )
+
+    # Fetch per-changeset metadata concurrently - each lookup is dominated by
+    # subprocess/network I/O, so threads overlap the waiting
+    metadata_by_filepath = {}
+    if filepaths:
+        # Prime the shared caches once before fanning out to avoid racing
+        # the lazy initialization across threads
+        _bulk_pr_metadata()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            lookup = functools.partial(get_changeset_metadata, git_info=git_info)
+            metadata_by_filepath = dict(zip(filepaths, executor.map(lookup, filepaths)))
+
     # Add sections for each change type
+    prefix_cache: dict[tuple, str] = {}
     for change_type in ["major", "minor", "patch"]:
         if change_type not in grouped:
             continue
 
         # Get the change type label
-        type_label = {
-            "major": "Major Changes",
-            "minor": "Minor Changes",
-            "patch": "Patch Changes",
-        }.get(change_type, f"{change_type.capitalize()} Changes")
+        type_label = _TYPE_LABELS.get(
+            change_type, f"{change_type.capitalize()} Changes"
+        )
 
-        lines.append(f"### {type_label}")
-        lines.append("")
+        buf.write(f"### {type_label}\n\n")
 
         # Add each entry
         for entry in grouped[change_type]:
             # Get metadata specific to this changeset if available
-            if "filepath" in entry:
-                changeset_metadata = get_changeset_metadata(entry["filepath"])
-            else:
-                changeset_metadata = pr_metadata
-            lines.append(format_changelog_entry(entry, config, changeset_metadata))
+            changeset_metadata = metadata_by_filepath.get(
+                entry.get("filepath"), pr_metadata
+            )
 
-        lines.append("")
+            # Entries from the same PR/commit share their prefix, so build
+            # it once per metadata rather than once per entry
+            key = (
+                changeset_metadata.get("pr_number"),
+                changeset_metadata.get("commit_hash"),
+            )
+            prefix = prefix_cache.get(key)
+            if prefix is None:
+                prefix = prefix_cache[key] = _metadata_prefix(changeset_metadata)
+
+            buf.write(format_changelog_entry(entry, config, changeset_metadata, prefix))
+            buf.write("\n")
 
-    return "\n".join(lines).strip()
+        buf.write("\n")
+
+    return buf.getvalue().strip()
 
 
 def update_or_create_changelog(
@@ -480,44 +697,47 @@ def update_or_create_changelog(
 ) -> bool:
     """Update or create a changelog file."""
     if changelog_path.exists():
-        content = changelog_path.read_text()
+        data = changelog_path.read_bytes()
     else:
         # Create new changelog with package name header
-        content = f"# {package_name}\n\n"
-
-    # Insert the new section after the package name header
-    lines = content.split("\n")
-    insert_index = None
-
-    # Find where to insert (after header, before first version)
-    for i, line in enumerate(lines):
-        if line.startswith("# "):
-            # Found header, insert after next blank line
-            for j in range(i + 1, len(lines)):
-                if not lines[j].strip():
-                    insert_index = j + 1
-                    break
-            if insert_index is None:
-                insert_index = i + 1
-            break
+        data = f"# {package_name}\n\n".encode()
 
-    if insert_index is None:
-        # No header found, just prepend
-        new_content = new_section + "\n\n" + content
+    section = new_section.encode() + b"\n\n"
+
+    # Find the package name header (insert after it, before first version)
+    if data.startswith(b"# "):
+        header_start = 0
     else:
-        # Insert at the found position
-        lines.insert(insert_index, new_section)
-        lines.insert(insert_index + 1, "")
-        new_content = "\n".join(lines)
+        marker = data.find(b"\n# ")
+        header_start = marker + 1 if marker != -1 else -1
 
-    # Write the updated content
-    changelog_path.write_text(new_content)
+    if header_start == -1:
+        # No header found, just prepend
+        new_data = section + data
+    else:
+        header_end = data.find(b"\n", header_start)
+        if header_end == -1:
+            data += b"\n"
+            header_end = len(data) - 1
+
+        # Insert after the blank line that follows the header, or directly
+        # after the header if there is none
+        blank = data.find(b"\n\n", header_end)
+        insert_at = blank + 2 if blank != -1 else header_end + 1
+        new_data = data[:insert_at] + section + data[insert_at:]
+
+    # Splice on the byte buffer and write once, via a temporary sibling so
+    # an interrupted run never leaves a truncated changelog behind
+    tmp_path = changelog_path.with_suffix(".md.tmp")
+    tmp_path.write_bytes(new_data)
+    os.replace(tmp_path, changelog_path)
     return True
 
 
 def generate_pr_description(package_updates: list[dict]) -> str:
     """Generate a combined PR description for all package updates."""
-    lines = ["# Releases", ""]
+    buf = io.StringIO()
+    buf.write("# Releases\n")
 
     for update in package_updates:
         package = update["package"]
@@ -525,45 +745,39 @@ def generate_pr_description(package_updates: list[dict]) -> str:
         changelog_content = update["changelog_content"]
 
         # Add package header
-        lines.append(f"## {package}@{version}")
-        lines.append("")
+        buf.write(f"\n## {package}@{version}\n\n")
 
         # Add the changelog content (without the package header)
         # Skip the first line if it's a version header
-        changelog_lines = changelog_content.split("\n")
-        start_index = 0
-        if changelog_lines and changelog_lines[0].startswith("## "):
-            start_index = 1
+        if changelog_content.startswith("## "):
+            _, _, changelog_content = changelog_content.partition("\n")
 
-        lines.extend(changelog_lines[start_index:])
-        lines.append("")
+        buf.write(changelog_content)
+        buf.write("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def process_changesets_for_changelog() -> tuple[list[dict], str]:
+def process_changesets_for_changelog(
+    config: dict, git_info: dict
+) -> tuple[list[dict], str]:
     """
     Process changesets to generate changelog entries and PR description.
     Returns (package_updates, pr_description).
     """
-    config = load_config()
-    pr_metadata = get_pr_metadata()
+    pr_metadata = get_pr_metadata(git_info)
 
     # Get all changesets
     changesets = get_changesets_from_changeset()
     if not changesets:
         return [], ""
 
-    # Group changesets by package
-    package_changes = {}
-    changeset_files = set()
+    # Group changesets by package; the change types live on the entries, so
+    # a flat package -> entries mapping is all that's needed
+    package_changes: dict[str, list[dict]] = {}
 
     for filepath, package, change_type, desc in changesets:
-        changeset_files.add(filepath)
-        if package not in package_changes:
-            package_changes[package] = {"changes": [], "descriptions": []}
-        package_changes[package]["changes"].append(change_type)
-        package_changes[package]["descriptions"].append(
+        package_changes.setdefault(package, []).append(
             {
                 "type": change_type,
                 "description": desc,
@@ -575,7 +789,7 @@ def process_changesets_for_changelog() -> tuple[list[dict], str]:
     # Process each package
     package_updates = []
 
-    for package, info in package_changes.items():
+    for package, entries in package_changes.items():
         # Find pyproject.toml
         try:
             pyproject_path = find_project_pyproject(package)
@@ -584,13 +798,13 @@ def process_changesets_for_changelog() -> tuple[list[dict], str]:
             continue
 
         # Determine new version
-        bump_type = determine_version_bump(info["changes"])
+        bump_type = determine_version_bump([entry["type"] for entry in entries])
         current_version = get_current_version(pyproject_path)
         new_version = bump_version(current_version, bump_type)
 
         # Generate changelog content
         changelog_content = generate_changelog_section(
-            package, new_version, info["descriptions"], config, pr_metadata
+            package, new_version, entries, config, pr_metadata, git_info
         )
 
         # Find changelog path (same directory as pyproject.toml)
@@ -623,8 +837,13 @@ def main(dry_run: bool, output_pr_description: str):
 
     click.echo(click.style("📜 Generating changelogs...\n", fg="cyan", bold=True))
 
+    # Resolve shared state once and thread it through explicitly rather than
+    # re-deriving it inside the hot paths
+    config = load_config()
+    git_info = get_git_info()
+
     # Process changesets
-    package_updates, pr_description = process_changesets_for_changelog()
+    package_updates, pr_description = process_changesets_for_changelog(config, git_info)
 
     if not package_updates:
         click.echo(click.style("No changesets found. Nothing to do!", fg="yellow"))
@@ -4,28 +4,122 @@ Changeset CLI - Interactive tool for creating changeset files.
 Similar to JavaScript changesets but for Python projects.
 """
 
+import functools
 import json
 import os
 import re
+import subprocess
 import sys
 import tomllib
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-import git
 import questionary
-import toml
-from packaging.version import InvalidVersion, Version
 from questionary import Choice
 from rich.console import Console
-from rich.prompt import Confirm
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 
 console = Console()
 
 CHANGESET_DIR = Path(".changeset")
 CONFIG_FILE = CHANGESET_DIR / "config.json"
 
+# Directories never entered during project discovery; hidden directories
+# are pruned by prefix, so .git, .venv and friends need no entries here
+_SKIP_DIRS = frozenset(
+    {
+        "venv",
+        "env",
+        "build",
+        "dist",
+        "__pycache__",
+        "node_modules",
+    }
+)
+
+# Frontmatter entry inside the --- markers of a changeset file
+_PACKAGE_RE = re.compile(r'"([^"]+)":\s*(\w+)')
+# version = "..." line inside the [project] table (and not a later table)
+_PROJECT_VERSION_RE = re.compile(
+    r'(^\[project\][^\[]*?^version\s*=\s*")[^"]*(")', re.MULTILINE | re.DOTALL
+)
+
+
+def _detect_base_branch_from_refs() -> str:
+    """Pick main/master by scanning remote (then local) refs in one git call."""
+    try:
+        result = subprocess.run(
+            ["git", "for-each-ref", "--format=%(refname)"],
+            capture_output=True,
+            text=True,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+        )
+        refs = result.stdout.splitlines()
+        # Exact branch-name matches; a substring scan would hit refs like
+        # 'maintenance' or 'main-backup'
+        remote_branches = {
+            ref.rsplit("/", 1)[-1] for ref in refs if ref.startswith("refs/remotes/")
+        }
+        if not remote_branches:
+            raise ValueError("No remote-tracking refs")
+
+        has_main = "main" in remote_branches
+        has_master = "master" in remote_branches
+
+        if has_main and has_master:
+            console.print(
+                "❌ Error: Both 'main' and 'master' branches exist in the repository.",
+                style="red",
+            )
+            console.print("Please remove one of them to avoid ambiguity.", style="red")
+            sys.exit(1)
+        elif has_main:
+            return "main"
+        elif has_master:
+            return "master"
+
+        # Fallback to checking local branches
+        local_branches = [
+            ref.removeprefix("refs/heads/")
+            for ref in refs
+            if ref.startswith("refs/heads/")
+        ]
+        if "main" in local_branches and "master" in local_branches:
+            console.print(
+                "❌ Error: Both 'main' and 'master' branches exist.",
+                style="red",
+            )
+            console.print("Please remove one of them to avoid ambiguity.", style="red")
+            sys.exit(1)
+        elif "main" in local_branches:
+            return "main"
+        elif "master" in local_branches:
+            return "master"
+        else:
+            # Default to main if no branches exist yet
+            return "main"
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        # Default to main if git is not available
+        return "main"
+
 
 def init_changesets():
     """Initialize changesets configuration."""
@@ -42,54 +136,31 @@ def init_changesets():
         "baseBranch": "main",
     }
 
-    # Detect base branch automatically
+    # Detect base branch automatically. origin/HEAD names the default
+    # branch outright when the clone recorded it, so try that first
+    base_branch = None
     try:
-        repo = git.Repo(".")
-        remote_refs = [ref.name for ref in repo.remote().refs]
-
-        has_main = any("main" in ref for ref in remote_refs)
-        has_master = any("master" in ref for ref in remote_refs)
+        result = subprocess.run(
+            ["git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+        )
+        if result.returncode == 0 and "/" in result.stdout:
+            base_branch = result.stdout.strip().split("/", 1)[1]
+    except OSError:
+        pass
 
-        if has_main and has_master:
-            console.print(
-                "❌ Error: Both 'main' and 'master' branches exist in the repository.",
-                style="red",
-            )
-            console.print("Please remove one of them to avoid ambiguity.", style="red")
-            sys.exit(1)
-        elif has_main:
-            base_branch = "main"
-        elif has_master:
-            base_branch = "master"
-        else:
-            # Fallback to checking local branches
-            local_branches = [branch.name for branch in repo.branches]
-            if "main" in local_branches and "master" in local_branches:
-                console.print(
-                    "❌ Error: Both 'main' and 'master' branches exist.",
-                    style="red",
-                )
-                console.print(
-                    "Please remove one of them to avoid ambiguity.", style="red"
-                )
-                sys.exit(1)
-            elif "main" in local_branches:
-                base_branch = "main"
-            elif "master" in local_branches:
-                base_branch = "master"
-            else:
-                # Default to main if no branches exist yet
-                base_branch = "main"
-    except Exception:
-        # Default to main if git is not available
-        base_branch = "main"
+    # Fall back to scanning the remote-tracking and local refs in one call
+    if base_branch is None:
+        base_branch = _detect_base_branch_from_refs()
 
     config["baseBranch"] = base_branch
     console.print(f"✅ Detected base branch: {base_branch}", style="green")
 
     # Write config
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    CONFIG_FILE.write_bytes(_json_dumps_indented(config))
 
     # Create README.md
     readme_path = CHANGESET_DIR / "README.md"
@@ -106,124 +177,292 @@ Run `changeset` or `changeset add` to create a new changeset.
 See https://github.com/the-roaring/pychangeset for more information.
 """
 
-    with open(readme_path, "w") as f:
-        f.write(readme_content)
+    readme_path.write_bytes(readme_content.encode())
+
+    # The cached config (if any) predates the file just written
+    load_config.cache_clear()
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load changeset configuration."""
-    if not CONFIG_FILE.exists():
-        # Auto-initialize if config doesn't exist
-        console.print("🚀 Initializing changesets...", style="cyan bold")
-        init_changesets()
-        console.print("✨ Changesets initialized successfully!\n", style="green bold")
+    """Load changeset configuration.
 
-    with open(CONFIG_FILE) as f:
-        return json.load(f)
+    Raises FileNotFoundError when changesets aren't initialized; commands
+    that want auto-initialization handle that explicitly instead of every
+    config read paying the git and filesystem work of init.
+    """
+    return _json_loads(CONFIG_FILE.read_bytes())
 
 
-def find_python_projects(root_path: Path = Path(".")) -> list[tuple[Path, str]]:
-    """Find all Python projects (directories with pyproject.toml) in the repository."""
-    projects = []
-
-    # Find all pyproject.toml files
-    for pyproject_path in root_path.rglob("pyproject.toml"):
-        # Skip hidden directories and common build/env directories
-        parts = pyproject_path.parts
-        if any(
-            part.startswith(".")
-            or part in ["venv", "env", "build", "dist", "__pycache__"]
-            for part in parts
-        ):
-            continue
+# On-disk tier of the project-discovery cache; validated against the
+# candidate path set from `git ls-files` and the (mtime_ns, size) of every
+# pyproject.toml it recorded
+_PROJECT_CACHE_FILE = CHANGESET_DIR / ".cache" / "projects.json"
 
-        # Read the project name
-        try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
-                project_name = data.get("project", {}).get(
-                    "name", pyproject_path.parent.name
-                )
-                projects.append((pyproject_path.parent, project_name))
-        except Exception:
-            # If we can't read it, use the directory name
-            projects.append((pyproject_path.parent, pyproject_path.parent.name))
 
-    return sorted(projects, key=lambda x: x[1])
+def _read_project_cache(
+    candidates: list[Path],
+) -> tuple[tuple[Path, str, str], ...] | None:
+    """Load the cached discovery result, or None if it is missing or stale.
+
+    The candidate list is the fresh `git ls-files` enumeration; a cache
+    recorded against a different path set is stale (a package was added,
+    moved or removed), as is one whose recorded pyproject stats changed.
+    """
+    # Any anomaly — unreadable file, bad JSON, or JSON of the wrong shape
+    # (not a dict, entries without four fields) — is just a cache miss
+    try:
+        raw = _json_loads(_PROJECT_CACHE_FILE.read_bytes())
+
+        if set(raw.get("candidates", ())) != {str(path) for path in candidates}:
+            return None
+
+        projects = []
+        for path_str, (mtime_ns, size, name, version) in raw["projects"].items():
+            stat = os.stat(Path(path_str) / "pyproject.toml")
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                return None
+            projects.append((Path(path_str), name, version))
+    except (OSError, ValueError, TypeError, AttributeError, KeyError):
+        return None
 
+    return tuple(projects)
+
+
+def _write_project_cache(
+    candidates: list[Path], projects: tuple[tuple[Path, str, str], ...]
+) -> None:
+    """Persist the discovery result; best-effort, skipped without .changeset."""
+    if not CHANGESET_DIR.is_dir():
+        return
 
-def get_changed_files() -> set[str]:
-    """Get set of changed files in the filesystem (unstaged and staged)."""
     try:
-        repo = git.Repo(".")
-
-        changed_files = set()
-
-        # Get unstaged changes
-        for item in repo.index.diff(None):
-            if item.a_path:
-                changed_files.add(item.a_path)
-            if item.b_path:
-                changed_files.add(item.b_path)
-
-        # Get staged changes
-        for item in repo.index.diff("HEAD"):
-            if item.a_path:
-                changed_files.add(item.a_path)
-            if item.b_path:
-                changed_files.add(item.b_path)
-
-        # Get untracked files
-        for item in repo.untracked_files:
-            changed_files.add(item)
-
-        return changed_files
-    except Exception:
+        entries = {
+            "candidates": sorted(str(path) for path in candidates),
+            "projects": {},
+        }
+        for path, name, version in projects:
+            stat = os.stat(path / "pyproject.toml")
+            entries["projects"][str(path)] = [
+                stat.st_mtime_ns,
+                stat.st_size,
+                name,
+                version,
+            ]
+
+        cache_dir = _PROJECT_CACHE_FILE.parent
+        if not cache_dir.is_dir():
+            # Self-ignoring cache directory (the pytest/ruff cache
+            # pattern), so the cache never shows up in git status
+            cache_dir.mkdir()
+            (cache_dir / ".gitignore").write_bytes(b"*\n")
+        tmp_path = _PROJECT_CACHE_FILE.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(entries))
+        os.replace(tmp_path, _PROJECT_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _candidate_pyprojects(root: str) -> list[Path]:
+    """Locate every pyproject.toml under root.
+
+    One `git ls-files` call, which honors .gitignore and never touches
+    ignored trees. Outside git only the root pyproject.toml is considered;
+    the full workflow needs a repository anyway.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "-C",
+                root,
+                "ls-files",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+                "-z",
+                "--",
+                "*pyproject.toml",
+            ],
+            capture_output=True,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        result = None
+
+    if result is None:
+        # Outside a git tree the rest of the workflow can't do anything
+        # useful with a deep walk, so only consider root itself
+        root_pyproject = Path(root) / "pyproject.toml"
+        return [root_pyproject] if root_pyproject.is_file() else []
+
+    candidates = []
+    for name in result.stdout.decode("utf-8", errors="replace").split("\0"):
+        path = Path(name) if root == "." else Path(root) / name
+        if path.name != "pyproject.toml":
+            continue
+        # Apply the same exclusions as the old tree walk for untracked
+        # files; the isdisjoint test runs at C level against the frozenset
+        dirs = path.parts[:-1]
+        if not _SKIP_DIRS.isdisjoint(dirs) or any(p[:1] == "." for p in dirs):
+            continue
+        candidates.append(path)
+    return candidates
+
+
+def _parse_project(pyproject_path: Path) -> tuple[Path, str, str]:
+    """Read one pyproject.toml into a (project_dir, name, version) tuple."""
+    project_name = pyproject_path.parent.name
+    version = "0.0.0"
+    try:
+        # Slurp and parse from memory; tomllib.load against a stream is
+        # slower than one read for files this small
+        project = tomllib.loads(pyproject_path.read_bytes().decode("utf-8")).get(
+            "project", {}
+        )
+        project_name = project.get("name", project_name)
+        version = project.get("version", version)
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+        # If we can't read it, keep the directory name
+        pass
+
+    return (pyproject_path.parent, project_name, version)
+
+
+@functools.lru_cache(maxsize=4)
+def _discover_projects(cwd: str, root: str) -> tuple[tuple[Path, str, str], ...]:
+    """Find and parse each pyproject.toml once.
+
+    Returns (project_dir, name, version) tuples sorted by name. Keyed by the
+    working directory so processes that chdir - like the test suite - get
+    fresh results. Repo-root walks also persist to an on-disk cache that is
+    reused while the candidate set and the recorded pyprojects are unchanged,
+    skipping only the TOML parses — the cheap ls-files enumeration always
+    runs so added or moved packages invalidate the cache.
+    """
+    candidates = _candidate_pyprojects(root)
+
+    if root == ".":
+        cached = _read_project_cache(candidates)
+        if cached is not None:
+            return cached
+
+    # Each parse is independent read-dominated work, so fan it out
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+            projects = list(executor.map(_parse_project, candidates))
+    else:
+        projects = [_parse_project(path) for path in candidates]
+
+    result = tuple(sorted(projects, key=lambda x: x[1]))
+    if root == ".":
+        _write_project_cache(candidates, result)
+    return result
+
+
+def find_python_projects(root_path: Path = Path(".")) -> list[tuple[Path, str]]:
+    """Find all Python projects (directories with pyproject.toml) in the repository."""
+    return [
+        (project_path, project_name)
+        for project_path, project_name, _ in _discover_projects(
+            os.getcwd(), str(root_path)
+        )
+    ]
+
+
+def get_changed_files(pathspecs: tuple[str, ...] = ()) -> set[str]:
+    """Get set of changed files in the filesystem (unstaged and staged).
+
+    When pathspecs are given git only walks those subtrees, which keeps
+    the status scan proportional to the projects we care about rather
+    than the whole repository.
+    """
+    # One `git status` covers staged, unstaged and untracked files; -z
+    # delimits with NUL so filenames with embedded newlines survive.
+    # --no-optional-locks is a global git option, so it goes before the
+    # subcommand
+    cmd = [
+        "git",
+        "--no-optional-locks",
+        "status",
+        "--porcelain",
+        "-z",
+        "--untracked-files=all",
+        "--no-ahead-behind",
+    ]
+    if pathspecs:
+        cmd += ["--", *pathspecs]
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        stdin=subprocess.DEVNULL,
+        close_fds=False,
+    )
+    if result.returncode != 0:
         return set()
 
+    changed_files = set()
+    entries = iter(result.stdout.decode("utf-8", errors="replace").split("\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        status, path = entry[:2], entry[3:]
+        changed_files.add(path)
+        # Rename/copy entries carry the original path in the next field
+        if "R" in status or "C" in status:
+            changed_files.add(next(entries, ""))
+
+    changed_files.discard("")
+    return changed_files
+
 
 def get_project_changes(
     projects: list[tuple[Path, str]], changed_files: set[str]
 ) -> tuple[list[tuple[Path, str]], list[tuple[Path, str]]]:
     """Determine which projects have changes."""
-    changed_projects = []
-    unchanged_projects = []
-
-    repo_root = Path(".").resolve()
+    # Trie of directory components: each node maps a directory name to its
+    # child node, with the project rooted at that directory stored under
+    # None. Matching a file is then one walk down its own components,
+    # independent of the number of projects.
+    trie: dict = {}
+    eligible = []
 
     for project_path, project_name in projects:
-        # Resolve the project path to absolute
-        project_abs_path = project_path.resolve()
-
-        # Calculate relative path
-        try:
-            project_rel_path = project_abs_path.relative_to(repo_root)
-        except ValueError:
+        # Discovery hands out paths relative to the repo root, so a pure
+        # string relpath suffices — no realpath syscall per project
+        project_rel = os.path.relpath(project_path)
+        if project_rel.startswith(".."):
             # If project is not under repo root, skip it
             continue
 
-        has_changes = False
-
-        # Check if any changed file is within this project
-        for changed_file in changed_files:
-            try:
-                changed_file_path = Path(changed_file)
-                # If it's the root project (.), any change counts
-                if str(project_rel_path) == ".":
-                    has_changes = True
-                    break
-                # Otherwise check if the file is under the project directory
-                changed_file_path.relative_to(project_rel_path)
-                has_changes = True
+        eligible.append((project_path, project_name))
+        node = trie
+        if project_rel != ".":
+            for part in project_rel.split(os.sep):
+                node = node.setdefault(part, {})
+        node[None] = (project_path, project_name)
+
+    changed = set()
+    for changed_file in changed_files:
+        # Every project rooted at an ancestor directory owns the change;
+        # the root project (if any) sits at the trie root
+        node = trie
+        if (owner := node.get(None)) is not None:
+            changed.add(owner)
+        for part in changed_file.split("/")[:-1]:
+            node = node.get(part)
+            if node is None:
                 break
-            except ValueError:
-                # File is not under this project directory
-                continue
+            if (owner := node.get(None)) is not None:
+                changed.add(owner)
+        # Once every project is marked the remaining files can't add more
+        if len(changed) == len(eligible):
+            break
 
-        if has_changes:
-            changed_projects.append((project_path, project_name))
-        else:
-            unchanged_projects.append((project_path, project_name))
+    changed_projects = [project for project in eligible if project in changed]
+    unchanged_projects = [project for project in eligible if project not in changed]
 
     return changed_projects, unchanged_projects
 
@@ -246,29 +485,27 @@ def select_packages(
                 console.print(f"  • {name}", style="green")
         return changed_projects
 
-    # Build choices list
-    choices = []
-    package_map = {}
+    # Build choices list; each Choice carries its (path, name) tuple as the
+    # value, so no reverse lookup map is needed after the prompt
+    choices: list = []
 
     # Add section separators and packages
     if changed_projects:
-        # Add a visual separator for changed packages
         choices.append(questionary.Separator("── Changed packages ──"))
-        for path, name in changed_projects:
-            value = f"changed_{name}"
-            choices.append(Choice(title=name, value=value, checked=True))
-            package_map[value] = (path, name)
+        choices.extend(
+            Choice(title=name, value=(path, name), checked=True)
+            for path, name in changed_projects
+        )
 
     if unchanged_projects:
-        # Add a visual separator for unchanged packages
         choices.append(questionary.Separator("── Unchanged packages ──"))
-        for path, name in unchanged_projects:
-            value = f"unchanged_{name}"
-            choices.append(Choice(title=name, value=value, checked=False))
-            package_map[value] = (path, name)
+        choices.extend(
+            Choice(title=name, value=(path, name), checked=False)
+            for path, name in unchanged_projects
+        )
 
     # If no packages at all
-    if not package_map:
+    if not choices:
         console.print("No packages found in the repository.", style="yellow")
         return []
 
@@ -283,123 +520,153 @@ def select_packages(
         console.print("❌ Cancelled", style="red")
         return []
 
-    # Extract actual packages from the results
-    result = []
-    for value in selected:
-        if value in package_map:
-            result.append(package_map[value])
-
-    return result
+    # The choice values already are the (path, name) tuples
+    return selected
 
 
 def generate_changeset_name() -> str:
-    """Generate a unique changeset filename."""
+    """Generate a changeset filename candidate."""
     import coolname
 
-    # Generate names until we find one that doesn't exist
-    for _ in range(10):  # 10 attempts
-        name = coolname.generate_slug(3)
-        if not (CHANGESET_DIR / f"{name}.md").exists():
-            return name
+    return coolname.generate_slug(3)
+
 
-    # Fallback to timestamp + random string after 100 attempts
-    import uuid
+def _fallback_changeset_name() -> str:
+    """Timestamp + random suffix name for when the pretty slugs collide."""
+    import secrets
+    import time
 
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    random_suffix = str(uuid.uuid4()).split("-")[0][:6]
-    return f"changeset-{timestamp}-{random_suffix}"
+    return f"changeset-{time.time_ns():x}-{secrets.token_hex(3)}"
+
+
+def _open_new_changeset() -> tuple[int, Path]:
+    """Atomically create a uniquely named changeset file.
+
+    O_CREAT|O_EXCL makes the kernel arbitrate uniqueness, so there is no
+    stat-then-create race and no pre-check stat per candidate name.
+    """
+    for _ in range(10):  # 10 attempts
+        filepath = CHANGESET_DIR / f"{generate_changeset_name()}.md"
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        return fd, filepath
+
+    filepath = CHANGESET_DIR / f"{_fallback_changeset_name()}.md"
+    return os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644), filepath
 
 
 def create_changeset(packages: list[tuple[str, str]], description: str) -> str:
     """Create a changeset file and return its path."""
-    # Generate filename
-    filename = f"{generate_changeset_name()}.md"
-    filepath = CHANGESET_DIR / filename
-
     # Create changeset content
-    content = "---\n"
-    for package_name, change_type in packages:
-        content += f'"{package_name}": {change_type}\n'
-    content += "---\n\n"
-    content += description + "\n"
+    parts = ["---\n"]
+    parts.extend(
+        f'"{package_name}": {change_type}\n' for package_name, change_type in packages
+    )
+    parts.append(f"---\n\n{description}\n")
+    data = "".join(parts).encode("utf-8")
 
-    with open(filepath, "w") as f:
-        f.write(content)
+    # One open, one write
+    fd, filepath = _open_new_changeset()
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
     return str(filepath)
 
 
 def parse_changeset(filepath: Path) -> list[tuple[str, str, str]]:
     """Parse a changeset file and return list of (package, change_type, description)."""
-    with open(filepath) as f:
-        content = f.read()
+    content = filepath.read_text().strip()
 
-    # Parse frontmatter
-    lines = content.strip().split("\n")
-
-    if lines[0] != "---":
+    # Split frontmatter from description with C-level partition: opening
+    # marker, then everything up to the first closing marker
+    if not content.startswith("---\n"):
         raise ValueError(f"Invalid changeset format in {filepath}")
-
-    # Find end of frontmatter
-    end_idx = None
-    for i, line in enumerate(lines[1:], 1):
-        if line == "---":
-            end_idx = i
-            break
-
-    if end_idx is None:
+    frontmatter, sep, description = content[4:].partition("\n---")
+    if not sep:
         raise ValueError(f"Invalid changeset format in {filepath}")
 
     # Parse packages and change types
-    packages = []
-    for line in lines[1:end_idx]:
-        if line.strip():
-            match = re.match(r'"(.+)":\s*(\w+)', line.strip())
-            if match:
-                package = match.group(1)
-                change_type = match.group(2)
-                packages.append((package, change_type))
-
-    # Get description (everything after frontmatter)
-    description = "\n".join(lines[end_idx + 1 :]).strip()
+    packages = _PACKAGE_RE.findall(frontmatter)
+    description = description.strip()
 
     # Return with same description for all packages
     return [(pkg, ct, description) for pkg, ct in packages]
 
 
-def get_changesets() -> list[tuple[Path, str, str, str]]:
-    """Get all changeset files and parse them."""
-    changesets = []
+def _changeset_dir_signature() -> int:
+    """Nanosecond mtime of the changeset directory, 0 if it doesn't exist."""
+    try:
+        return os.stat(CHANGESET_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _safe_parse_changeset(
+    filepath: Path,
+) -> tuple[Path, list[tuple[str, str, str]], Exception | None]:
+    """parse_changeset wrapper that reports errors instead of raising."""
+    try:
+        return filepath, parse_changeset(filepath), None
+    except (OSError, ValueError) as e:
+        # parse_changeset raises ValueError on malformed files
+        return filepath, [], e
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_changesets(signature: int) -> tuple[tuple[Path, str, str, str], ...]:
+    """Scan and parse the changeset directory for the given signature."""
+    try:
+        files = [
+            Path(entry.path)
+            for entry in os.scandir(CHANGESET_DIR)
+            if entry.name.endswith(".md") and entry.name != "README.md"
+        ]
+    except FileNotFoundError:
+        return ()
+
+    if not files:
+        return ()
 
-    for filepath in CHANGESET_DIR.glob("*.md"):
-        if filepath.name == "README.md":
+    # Parsing is read-dominated, so overlap the file I/O across a pool
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+        results = list(executor.map(_safe_parse_changeset, files))
+
+    changesets = []
+    for filepath, parsed, error in results:
+        if error is not None:
+            console.print(f"⚠️  Error parsing {filepath}: {error}", style="yellow")
             continue
+        for package, change_type, description in parsed:
+            changesets.append((filepath, package, change_type, description))
 
-        try:
-            parsed = parse_changeset(filepath)
-            for package, change_type, description in parsed:
-                changesets.append((filepath, package, change_type, description))
-        except Exception as e:
-            console.print(f"⚠️  Error parsing {filepath}: {e}", style="yellow")
+    return tuple(changesets)
 
-    return changesets
+
+def get_changesets() -> list[tuple[Path, str, str, str]]:
+    """Get all changeset files and parse them."""
+    # Keyed on the directory mtime so adding or removing changesets
+    # invalidates the cache while repeated calls stay free
+    return list(_cached_changesets(_changeset_dir_signature()))
 
 
 def determine_version_bump(changes: list[str]) -> str:
     """Determine the version bump type based on change types."""
-    has_major = any(ct == "major" for ct in changes)
-    has_minor = any(ct == "minor" for ct in changes)
-
-    if has_major:
+    seen = set(changes)
+    if "major" in seen:
         return "major"
-    elif has_minor:
+    if "minor" in seen:
         return "minor"
-    else:
-        return "patch"
+    return "patch"
 
 
 def parse_version(version_str: str) -> tuple[int, int, int]:
     """Parse semantic version string."""
+    from packaging.version import InvalidVersion, Version
+
     try:
         v = Version(version_str)
         # We only support simple X.Y.Z versions for changesets
@@ -422,22 +689,39 @@ def bump_version(current_version: str, bump_type: str) -> str:
         return f"{major}.{minor}.{patch + 1}"
 
 
-def find_project_pyproject(package_name: str) -> Path:
-    """Find the pyproject.toml for a given package."""
-    # Use existing find_python_projects function
-    projects = find_python_projects()
+@functools.lru_cache(maxsize=4)
+def _project_index(cwd: str) -> dict[str, tuple[Path, str]]:
+    """Package name -> (pyproject path, version) over the discovered projects."""
+    return {
+        name: (path / "pyproject.toml", version)
+        for path, name, version in _discover_projects(cwd, ".")
+    }
 
-    for project_path, project_name in projects:
-        if project_name == package_name:
-            return project_path / "pyproject.toml"
 
-    raise ValueError(f"Could not find pyproject.toml for package: {package_name}")
+def find_project_pyproject(package_name: str) -> Path:
+    """Find the pyproject.toml for a given package."""
+    entry = _project_index(os.getcwd()).get(package_name)
+    if entry is None:
+        raise ValueError(f"Could not find pyproject.toml for package: {package_name}")
+    return entry[0]
 
 
 def update_pyproject_version(filepath: Path, new_version: str):
-    """Update version in pyproject.toml using toml library."""
-    with open(filepath, "rb") as f:
-        data = tomllib.load(f)
+    """Update version in pyproject.toml, preserving formatting when possible."""
+    text = filepath.read_text(encoding="utf-8")
+
+    # Fast path: rewrite just the version line inside [project]. This
+    # skips the TOML round-trip and keeps comments and formatting intact
+    new_text, n = _PROJECT_VERSION_RE.subn(rf"\g<1>{new_version}\g<2>", text, count=1)
+    if n == 1:
+        tmp_path = filepath.with_suffix(".toml.tmp")
+        tmp_path.write_text(new_text, encoding="utf-8")
+        os.replace(tmp_path, filepath)
+        return
+
+    # Fallback: unusual layout (version not a plain quoted literal in
+    # [project]); round-trip through a TOML serializer as before
+    data = tomllib.loads(text)
 
     # Update version
     if "project" in data:
@@ -445,16 +729,27 @@ def update_pyproject_version(filepath: Path, new_version: str):
     else:
         raise ValueError(f"No [project] section in {filepath}")
 
-    # Write back using toml library
-    with open(filepath, "w") as f:
-        toml.dump(data, f)
+    # Prefer tomli-w when installed; its emitter pairs with stdlib tomllib
+    try:
+        import tomli_w
+
+        filepath.write_bytes(tomli_w.dumps(data).encode())
+    except ImportError:
+        import toml
 
+        with open(filepath, "w") as f:
+            toml.dump(data, f)
 
+
+@functools.cache
 def get_current_version(pyproject_path: Path) -> str:
     """Get current version from pyproject.toml."""
-    with open(pyproject_path, "rb") as f:
-        data = tomllib.load(f)
+    # Serve from the discovery cache when the file was already parsed there
+    for project_path, _, version in _discover_projects(os.getcwd(), "."):
+        if project_path / "pyproject.toml" == pyproject_path:
+            return version
 
+    data = tomllib.loads(pyproject_path.read_bytes().decode("utf-8"))
     return data.get("project", {}).get("version", "0.0.0")
 
 
@@ -491,6 +786,8 @@ def changelog(dry_run: bool, output_pr_description: str):
 @cli.command()
 def init():
     """Initialize changesets in your project."""
+    from rich.prompt import Confirm
+
     console.print("🚀 Initializing changesets...", style="cyan bold")
 
     # Check if already initialized
@@ -526,19 +823,22 @@ def add(all: bool):
         )
         sys.exit(1)
 
-    # Get changed files
-    changed_files = get_changed_files()
-
-    # Determine which projects have changes
-    changed_projects, unchanged_projects = get_project_changes(projects, changed_files)
-
-    # Select packages
-    if all:
-        selected_packages = projects
-    elif len(projects) == 1:
-        # Skip selection if there's only one package
+    # Select packages. Only the interactive prompt needs to know which
+    # projects changed, so single-package repos and --all runs skip the
+    # git status call and the change bucketing entirely
+    if all or len(projects) == 1:
         selected_packages = projects
     else:
+        # Scope the status scan to the project subtrees unless one of
+        # them is the repo root, where scoping would be a no-op
+        project_rel_paths = [os.path.relpath(path) for path, _ in projects]
+        if "." in project_rel_paths:
+            changed_files = get_changed_files()
+        else:
+            changed_files = get_changed_files(tuple(project_rel_paths))
+        changed_projects, unchanged_projects = get_project_changes(
+            projects, changed_files
+        )
         selected_packages = select_packages(changed_projects, unchanged_projects)
 
     if not selected_packages:
@@ -546,33 +846,35 @@ def add(all: bool):
         sys.exit(1)
 
     # Get change type and description for each package
-    config = load_config()
+    try:
+        config = load_config()
+    except FileNotFoundError:
+        # First changeset in this repo - initialize on demand
+        console.print("🚀 Initializing changesets...", style="cyan bold")
+        init_changesets()
+        console.print("✨ Changesets initialized successfully!\n", style="green bold")
+        config = load_config()
     change_types = config.get("changeTypes", {})
 
+    # Build choices for change type selection once (patch first, major
+    # last); the list is identical for every package
+    type_choices = []
+    type_order = ["patch", "minor", "major"]  # Preferred order
+
+    for ct in type_order:
+        if ct in change_types:
+            info = change_types[ct]
+            emoji = info.get("emoji", "")
+            desc = info.get("description", ct)
+            type_choices.append({"name": f"{emoji} {ct} - {desc}", "value": ct})
+
     package_changes = []
+    project_index = _project_index(os.getcwd())
 
     for project_path, project_name in selected_packages:
-        # Try to get the current version
-        current_version = "unknown"
-        try:
-            pyproject_path = project_path / "pyproject.toml"
-            if pyproject_path.exists():
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-                    current_version = data.get("project", {}).get("version", "unknown")
-        except Exception:
-            pass
-
-        # Build choices for change type selection (patch first, major last)
-        type_choices = []
-        type_order = ["patch", "minor", "major"]  # Preferred order
-
-        for ct in type_order:
-            if ct in change_types:
-                info = change_types[ct]
-                emoji = info.get("emoji", "")
-                desc = info.get("description", ct)
-                type_choices.append({"name": f"{emoji} {ct} - {desc}", "value": ct})
+        # Discovery already parsed this project's pyproject.toml; reuse it
+        entry = project_index.get(project_name)
+        current_version = entry[1] if entry else "unknown"
 
         # Use questionary for change type selection
         change_type = questionary.select(
@@ -586,22 +888,24 @@ def add(all: bool):
             console.print("❌ Cancelled", style="red")
             sys.exit(1)
 
-        # Confirm major changes
-        if change_type == "major":
-            console.print("\n⚠️  Warning: Major version bump!", style="yellow bold")
-            console.print(
-                "This will trigger a major version bump (e.g., 1.2.3 → 2.0.0)"
-            )
-            console.print("Major bumps should only be used for breaking changes.")
-
-            if not questionary.confirm(
-                "Are you sure this is a breaking change?", default=False
-            ).ask():
-                console.print("Cancelled. Please select minor or patch instead.")
-                continue
-
         package_changes.append((project_name, change_type))
 
+    # Confirm major changes once for the whole batch, not per package
+    major_packages = [name for name, ct in package_changes if ct == "major"]
+    if major_packages:
+        console.print("\n⚠️  Warning: Major version bump!", style="yellow bold")
+        console.print("This will trigger a major version bump (e.g., 1.2.3 → 2.0.0)")
+        console.print("Major bumps should only be used for breaking changes.")
+        console.print(f"Affected: {', '.join(major_packages)}")
+
+        if not questionary.confirm(
+            "Are you sure these are breaking changes?", default=False
+        ).ask():
+            console.print("Cancelled. Please select minor or patch instead.")
+            package_changes = [
+                (name, ct) for name, ct in package_changes if ct != "major"
+            ]
+
     if not package_changes:
         console.print("❌ No changes recorded", style="red")
         sys.exit(1)
@@ -639,8 +943,6 @@ def add(all: bool):
 def check_changeset(skip_ci: bool):
     """Check if a changeset exists for the current branch."""
     # Pass the skip_ci flag through
-    import sys
-
     from changeset.check_changeset import main as check_main
 
     original_argv = sys.argv
@@ -663,21 +965,24 @@ def version(dry_run: bool, skip_changelog: bool):
 
     console.print("📦 Processing changesets...\n", style="cyan bold")
 
-    config = load_config()
+    try:
+        config = load_config()
+    except FileNotFoundError:
+        console.print("No changesets found. Nothing to do!", style="yellow")
+        return
     changesets = get_changesets()
 
     if not changesets:
         console.print("No changesets found. Nothing to do!", style="yellow")
         return
 
+    # Each parsed file may yield several rows; dedupe the paths up front
+    changeset_files = {filepath for filepath, _, _, _ in changesets}
+
     # Group changesets by package
-    package_changes = {}
-    changeset_files = set()
+    package_changes = defaultdict(lambda: {"changes": [], "descriptions": []})
 
     for filepath, package, change_type, desc in changesets:
-        changeset_files.add(filepath)
-        if package not in package_changes:
-            package_changes[package] = {"changes": [], "descriptions": []}
         package_changes[package]["changes"].append(change_type)
         package_changes[package]["descriptions"].append(
             {
@@ -695,11 +1000,13 @@ def version(dry_run: bool, skip_changelog: bool):
         style="green",
     )
 
+    change_types = config["changeTypes"]
     for package, info in package_changes.items():
         console.print(f"\n📦 {package}:")
+        # The preview line is the same for every change of the package
+        desc = info["descriptions"][0]["description"].partition("\n")[0][:60]
         for change_type in info["changes"]:
-            emoji = config["changeTypes"].get(change_type, {}).get("emoji", "")
-            desc = info["descriptions"][0]["description"].split("\n")[0][:60]
+            emoji = change_types.get(change_type, {}).get("emoji", "")
             console.print(f"  {emoji} {change_type}: {desc}...")
 
     if dry_run:
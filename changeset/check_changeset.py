@@ -15,6 +15,29 @@ SKIP_BRANCHES = ["main", "master", "develop", "release/*", "hotfix/*"]
 SKIP_PREFIXES = ["chore/", "docs/", "test/", "ci/", "build/"]
 
 
+def _current_branch() -> str | None:
+    """Current branch read straight from .git/HEAD; None when detached.
+
+    The branch name is the ref in a one-line file, so this avoids forking
+    a git process. In worktrees .git is a file pointing at the real git
+    directory; follow it.
+    """
+    git_path = Path(".git")
+    try:
+        if git_path.is_file():
+            gitdir = git_path.read_text().strip()
+            if not gitdir.startswith("gitdir:"):
+                return None
+            git_path = Path(gitdir.split(":", 1)[1].strip())
+        head = (git_path / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    if head.startswith("ref: refs/heads/"):
+        return head.removeprefix("ref: refs/heads/")
+    return None
+
+
 def should_skip_branch(branch_name: str) -> bool:
     """Check if branch should skip changeset requirement."""
     # Check exact matches
@@ -48,12 +71,9 @@ def main(skip_ci):
         sys.exit(0)
 
     try:
-        repo = git.Repo(".")
-
-        # Get current branch
-        try:
-            current_branch = repo.active_branch.name
-        except TypeError:
+        # Get current branch without forking git
+        current_branch = _current_branch()
+        if current_branch is None:
             # Detached HEAD state (common in CI)
             click.echo("Skipping changeset check in detached HEAD state")
             sys.exit(0)
@@ -63,6 +83,8 @@ def main(skip_ci):
             click.echo(f"Skipping changeset check for branch: {current_branch}")
             sys.exit(0)
 
+        repo = git.Repo(".")
+
         # Get uncommitted changeset files
         uncommitted_changesets = []
         for item in repo.index.entries:
@@ -9,6 +9,9 @@ from pathlib import Path
 
 import click
 
+# Frontmatter entry: quoted package name plus one of the change types
+_ENTRY_RE = re.compile(r'^"([^"]+)":\s*(major|minor|patch)$')
+
 
 def validate_changeset_file(filepath: Path) -> bool:
     """Validate a changeset file format."""
@@ -38,7 +41,7 @@ def validate_changeset_file(filepath: Path) -> bool:
         found_valid_entry = False
         for line in lines[1:end_idx]:
             if line.strip():
-                match = re.match(r'^"([^"]+)":\s*(major|minor|patch)$', line.strip())
+                match = _ENTRY_RE.match(line.strip())
                 if match:
                     found_valid_entry = True
                     break
@@ -8,6 +8,28 @@ import pytest
 from click.testing import CliRunner
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    """Reset module-level caches between tests.
+
+    The CLI is a one-shot process in production, but tests share one
+    interpreter while changing working directories.
+    """
+    from changeset.changeset import (
+        _cached_changesets,
+        _discover_projects,
+        _project_index,
+        get_current_version,
+        load_config,
+    )
+
+    _cached_changesets.cache_clear()
+    _discover_projects.cache_clear()
+    _project_index.cache_clear()
+    get_current_version.cache_clear()
+    load_config.cache_clear()
+
+
 @pytest.fixture
 def cli_runner() -> CliRunner:
     """Create a Click CLI runner."""
@@ -8,6 +8,7 @@ from changeset.changeset import (
     bump_version,
     determine_version_bump,
     find_python_projects,
+    get_changed_files,
     get_changesets,
     parse_changeset,
     parse_version,
@@ -172,6 +173,39 @@ class TestProjectDiscovery:
         assert projects[0][1] == "visible-package"
 
 
+class TestGetChangedFiles:
+    """Test changed-file detection via git status."""
+
+    def test_detects_modified_staged_and_untracked(self, temp_repo: Path):
+        """Test that all three kinds of pending change are reported."""
+        import os
+        import subprocess
+
+        os.chdir(temp_repo)
+
+        (temp_repo / "README.md").write_text("# Test Project, modified")
+        (temp_repo / "untracked.py").write_text("# new file")
+        (temp_repo / "staged.py").write_text("# staged file")
+        subprocess.run(
+            ["git", "add", "staged.py"],
+            cwd=temp_repo,
+            check=True,
+            capture_output=True,
+        )
+
+        changed = get_changed_files()
+
+        assert changed == {"README.md", "untracked.py", "staged.py"}
+
+    def test_clean_tree_reports_no_changes(self, temp_repo: Path):
+        """Test that a clean working tree yields an empty set."""
+        import os
+
+        os.chdir(temp_repo)
+
+        assert get_changed_files() == set()
+
+
 class TestGetChangesets:
     """Test getting and parsing all changesets."""
 